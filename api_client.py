@@ -1,15 +1,27 @@
 import time
 import logging
-from typing import Optional, Dict, Any, Callable
+import threading
+from collections import deque
+from itertools import islice
+from typing import Optional, Dict, Any, Callable, Iterator, List, TYPE_CHECKING
 from datetime import datetime, timedelta
-import requests
 from functools import wraps
 from config import APIProviderConfig, config
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    import requests
+
+# Logging is configured by the entry point (see example_usage.py), not on import
 logger = logging.getLogger(__name__)
 
+# How each provider splits list responses across pages.
+# "page": numbered pages, total announced in the first response (paging.current/paging.total)
+# "offset": limit/offset windows, echoed back in the response filters; total unknown
+PAGING_SCHEMES = {
+    "api-football": {"style": "page", "page_param": "page"},
+    "football-data": {"style": "offset", "limit_param": "limit", "offset_param": "offset"},
+}
+
 
 class RateLimiter:
     """Simple rate limiter for API calls"""
@@ -18,20 +30,23 @@ class RateLimiter:
         self.max_requests = max_requests
         self.period = period
         self.requests = []
+        self._lock = threading.Lock()
     
     def wait_if_needed(self):
-        """Wait if rate limit would be exceeded"""
-        now = time.time()
-        # Remove old requests outside the period
-        self.requests = [req_time for req_time in self.requests if now - req_time < self.period]
-        
-        if len(self.requests) >= self.max_requests:
-            wait_time = self.period - (now - self.requests[0])
-            if wait_time > 0:
-                logger.warning(f"Rate limit reached. Waiting {wait_time:.2f} seconds...")
-                time.sleep(wait_time)
-        
-        self.requests.append(now)
+        """Wait if rate limit would be exceeded (safe to share between threads)"""
+        with self._lock:
+            now = time.time()
+            # Remove old requests outside the period
+            self.requests = [req_time for req_time in self.requests if now - req_time < self.period]
+            
+            if len(self.requests) >= self.max_requests:
+                wait_time = self.period - (now - self.requests[0])
+                if wait_time > 0:
+                    logger.warning(f"Rate limit reached. Waiting {wait_time:.2f} seconds...")
+                    time.sleep(wait_time)
+                    now = time.time()
+            
+            self.requests.append(now)
 
 
 class SimpleCache:
@@ -67,8 +82,22 @@ class APIClient:
         self.provider = provider_config or config.get_provider()
         self.cache = SimpleCache(config.cache_duration) if config.enable_cache else None
         self.rate_limiter = RateLimiter(config.rate_limit_requests, config.rate_limit_period)
-        self.session = requests.Session()
-        self.session.headers.update(self.provider.get_headers())
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+    
+    @property
+    def session(self) -> "requests.Session":
+        """HTTP session, created (and requests imported) on first request"""
+        if self._session is None:
+            # Page prefetch threads may race to make the first request
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    
+                    session = requests.Session()
+                    session.headers.update(self.provider.get_headers())
+                    self._session = session
+        return self._session
     
     def _make_request(
         self, 
@@ -78,6 +107,8 @@ class APIClient:
         **kwargs
     ) -> Dict[str, Any]:
         """Make HTTP request with retry logic"""
+        import requests
+        
         url = f"{self.provider.base_url}/{endpoint.lstrip('/')}"
         
         for attempt in range(self.provider.retry_attempts):
@@ -135,6 +166,124 @@ class APIClient:
         
         return data
     
+    def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        items_key: str = "response",
+        use_cache: bool = True,
+        max_workers: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the items of every page of a list endpoint, in page order
+        
+        Uses the provider's paging scheme from PAGING_SCHEMES; providers without
+        one are treated as a single page.
+        """
+        params = dict(params or {})
+        scheme = PAGING_SCHEMES.get(self.provider.name)
+        
+        if scheme and scheme["style"] == "page":
+            yield from self._iter_numbered_pages(endpoint, params, items_key, use_cache, scheme, max_workers)
+        elif scheme and scheme["style"] == "offset":
+            yield from self._iter_offset_pages(endpoint, params, items_key, use_cache, scheme)
+        else:
+            data = self.get(endpoint, params=params, use_cache=use_cache)
+            yield data.get(items_key) or []
+    
+    def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        items_key: str = "response",
+        use_cache: bool = True,
+        max_workers: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every item of a list endpoint across all pages"""
+        for items in self.iter_pages(endpoint, params, items_key, use_cache, max_workers):
+            yield from items
+    
+    def _iter_numbered_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        items_key: str,
+        use_cache: bool,
+        scheme: Dict[str, Any],
+        max_workers: Optional[int]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Numbered pages; once the total is known, later pages are prefetched concurrently"""
+        first = self.get(endpoint, params=params, use_cache=use_cache)
+        yield first.get(items_key) or []
+        
+        paging = first.get("paging") or {}
+        current = int(paging.get("current") or 1)
+        total = int(paging.get("total") or current)
+        if total <= current:
+            return
+        
+        if total > config.max_pages:
+            logger.warning(f"{endpoint} reports {total} pages; fetching only the first {config.max_pages}")
+            total = config.max_pages
+        
+        def fetch(page: int) -> List[Dict[str, Any]]:
+            page_params = {**params, scheme["page_param"]: page}
+            return self.get(endpoint, params=page_params, use_cache=use_cache).get(items_key) or []
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        pages = iter(range(current + 1, total + 1))
+        workers = max(1, min(max_workers or config.max_concurrent_requests, total - current))
+        
+        # Keep up to `workers` pages in flight; every request still goes through the rate limiter
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight = deque(executor.submit(fetch, page) for page in islice(pages, workers))
+            try:
+                while in_flight:
+                    items = in_flight.popleft().result()
+                    next_page = next(pages, None)
+                    if next_page is not None:
+                        in_flight.append(executor.submit(fetch, next_page))
+                    yield items
+            finally:
+                for future in in_flight:
+                    future.cancel()
+    
+    def _iter_offset_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        items_key: str,
+        use_cache: bool,
+        scheme: Dict[str, Any]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Limit/offset windows, followed only while the response echoes the applied limit and offset"""
+        limit_param, offset_param = scheme["limit_param"], scheme["offset_param"]
+        
+        for _ in range(config.max_pages):
+            data = self.get(endpoint, params=params, use_cache=use_cache)
+            items = data.get(items_key) or []
+            filters = data.get("filters") or {}
+            
+            # A provider that ignores offset would return the same page forever
+            if offset_param in params:
+                echoed = filters.get(offset_param)
+                if echoed is None or int(echoed) != int(params[offset_param]):
+                    logger.warning(f"{endpoint} did not apply offset={params[offset_param]}; stopping pagination")
+                    return
+            
+            yield items
+            
+            limit = filters.get(limit_param)
+            # A short page ends the listing; a longer one means the limit was ignored
+            if not limit or len(items) != int(limit):
+                return
+            
+            offset = int(params.get(offset_param) or 0)
+            params = {**params, limit_param: int(limit), offset_param: offset + int(limit)}
+        else:
+            logger.warning(f"{endpoint} still had more results after {config.max_pages} pages; stopping")
+    
     def post(
         self, 
         endpoint: str, 
@@ -144,6 +293,12 @@ class APIClient:
         """Make POST request"""
         return self._make_request("POST", endpoint, json=data, **kwargs)
     
+    def close(self):
+        """Close the HTTP session, if one was created"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
     def clear_cache(self):
         """Clear all cached data"""
         if self.cache:
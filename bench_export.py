@@ -0,0 +1,93 @@
+"""
+Memory benchmark for bulk exports
+Runs exports of increasing length against a synthetic transport and checks peak memory stays flat
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+from datetime import date, timedelta
+
+# Synthetic provider: no network, no real key needed
+os.environ.setdefault("API_FOOTBALL_KEY", "bench")
+os.environ.setdefault("LOG_API_CALLS", "false")
+
+import config
+from api_client import APIClient
+from bulk_export import export_matches
+from football_service import FootballDataService
+
+MATCHES_PER_DAY = 60
+
+
+def fake_request(self, method, endpoint, params=None, **kwargs):
+    """Return an api-football style fixtures page for the requested date"""
+    day = (params or {}).get("date", "")
+    return {
+        "paging": {"current": 1, "total": 1},
+        "response": [
+            {
+                "fixture": {"id": hash((day, i)) & 0x7FFFFFFF, "date": f"{day}T15:00:00+00:00", "status": {"short": "FT", "elapsed": 90}},
+                "league": {"id": 39, "name": "Premier League", "country": "England", "logo": "https://example.invalid/39.png"},
+                "teams": {
+                    "home": {"id": i, "name": f"Home {i}", "logo": f"https://example.invalid/{i}.png"},
+                    "away": {"id": i + 1000, "name": f"Away {i}", "logo": f"https://example.invalid/{i + 1000}.png"}
+                },
+                "goals": {"home": i % 4, "away": i % 3}
+            }
+            for i in range(MATCHES_PER_DAY)
+        ]
+    }
+
+
+def measure(days: int, directory: str) -> dict:
+    """Export `days` days to NDJSON and report peak traced memory"""
+    service = FootballDataService("api-football")
+    start = date(2015, 1, 1)
+    path = os.path.join(directory, f"export-{days}.ndjson")
+
+    tracemalloc.start()
+    rows = export_matches(start, start + timedelta(days=days - 1), path, chunk_size=2000, service=service)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "days": days,
+        "rows": rows,
+        "peak_kb": peak / 1024,
+        "cached": len(service.client.cache.cache) if service.client.cache else 0
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that bulk export memory does not grow with the date range")
+    parser.add_argument("--short-days", type=int, default=30)
+    parser.add_argument("--long-days", type=int, default=730)
+    parser.add_argument("--max-growth", type=float, default=1.5, help="Allowed long/short peak ratio")
+    args = parser.parse_args()
+
+    APIClient._make_request = fake_request
+    config.init(use_dotenv=False, enable_cache=True)
+
+    with tempfile.TemporaryDirectory() as directory:
+        short = measure(args.short_days, directory)
+        long = measure(args.long_days, directory)
+
+    failed = False
+    for stats in (short, long):
+        print(
+            f"{stats['days']} days: {stats['rows']} matches, peak {stats['peak_kb']:.0f} KiB, "
+            f"{stats['cached']} cached responses"
+        )
+        failed = failed or stats["cached"] > 0
+
+    growth = long["peak_kb"] / short["peak_kb"]
+    print(f"peak growth {growth:.2f}x (limit {args.max_growth:.2f}x)")
+
+    return 1 if failed or growth > args.max_growth else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Import-time benchmark for worker processes
+Measures cold-start cost of importing the service modules in fresh interpreters
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules that must stay out of a bare import; they are loaded on first use
+DEFERRED_MODULES = ["requests", "dotenv", "concurrent.futures.thread"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str, runs: int) -> dict:
+    """Import a module in `runs` fresh interpreters and collect timings"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    probe = PROBE.format(module=module, deferred=DEFERRED_MODULES)
+    timings = []
+    loaded = set()
+
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=here,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(sample["ms"])
+        loaded.update(sample["loaded"])
+
+    return {
+        "module": module,
+        "runs": runs,
+        "median_ms": statistics.median(timings),
+        "max_ms": max(timings),
+        "eagerly_loaded": sorted(loaded)
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold import time of the service modules")
+    parser.add_argument("modules", nargs="*", default=["football_service"])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_BUDGET_MS", "50")))
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        stats = measure(module, args.runs)
+        over_budget = stats["median_ms"] > args.budget_ms
+        failed = failed or over_budget or bool(stats["eagerly_loaded"])
+
+        print(
+            f"{module}: median {stats['median_ms']:.1f} ms, max {stats['max_ms']:.1f} ms "
+            f"over {stats['runs']} runs (budget {args.budget_ms:.0f} ms)"
+            f"{' OVER BUDGET' if over_budget else ''}"
+        )
+        if stats["eagerly_loaded"]:
+            print(f"  imported eagerly: {', '.join(stats['eagerly_loaded'])}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+"""
+Streaming bulk export of fixtures to NDJSON, CSV or Parquet
+Fetches day by day, writes in chunks and checkpoints so long exports can resume
+"""
+
+import csv
+import json
+import logging
+import os
+from datetime import date, timedelta
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from football_service import FootballDataService
+
+logger = logging.getLogger(__name__)
+
+# Flat column layout shared by the CSV and Parquet writers
+FIELDS = [
+    "id", "date", "status", "minute",
+    "league_id", "league_name", "league_country", "league_logo",
+    "home_team_id", "home_team_name", "home_team_logo",
+    "away_team_id", "away_team_name", "away_team_logo",
+    "home_score", "away_score", "provider"
+]
+INTEGER_FIELDS = ("minute", "home_score", "away_score")
+
+
+def iter_days(start: date, end: date) -> Iterator[date]:
+    """Yield every date from start to end, inclusive"""
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+def iter_matches(
+    service: FootballDataService,
+    start: date,
+    end: date,
+    league_id: Optional[int] = None
+) -> Iterator[Tuple[date, List[Dict[str, Any]]]]:
+    """
+    Yield (day, normalized matches) one day at a time
+
+    Every day is fetched through the service's own client (no per-call
+    fallback), so the whole export shares one rate limiter and session and
+    never mixes ids from different providers. Each day is requested once,
+    so responses bypass the cache instead of piling up in it.
+    """
+    for day in iter_days(start, end):
+        yield day, list(service.iter_matches_by_date(day, league_id=league_id, use_cache=False))
+
+
+def flatten_match(match: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a normalized match into the FIELDS columns"""
+    league = match.get("league") or {}
+    home = match.get("home_team") or {}
+    away = match.get("away_team") or {}
+    score = match.get("score") or {}
+
+    return {
+        "id": match.get("id"),
+        "date": match.get("date"),
+        "status": match.get("status"),
+        "minute": match.get("minute"),
+        "league_id": league.get("id"),
+        "league_name": league.get("name"),
+        "league_country": league.get("country"),
+        "league_logo": league.get("logo"),
+        "home_team_id": home.get("id"),
+        "home_team_name": home.get("name"),
+        "home_team_logo": home.get("logo"),
+        "away_team_id": away.get("id"),
+        "away_team_name": away.get("name"),
+        "away_team_logo": away.get("logo"),
+        "home_score": score.get("home"),
+        "away_score": score.get("away"),
+        "provider": match.get("provider")
+    }
+
+
+# ============= Writers =============
+#
+# Writers are opened at a position previously returned by commit(); anything
+# written after that position by an interrupted run is discarded.
+
+class NDJSONWriter:
+    """One normalized match per line"""
+
+    def __init__(self, path: str, position: int = 0):
+        self.path = path
+        mode = "r+b" if position and os.path.exists(path) else "wb"
+        self._file = open(path, mode)
+        self._file.truncate(position if mode == "r+b" else 0)
+        self._file.seek(0, os.SEEK_END)
+
+    def write(self, matches: List[Dict[str, Any]]):
+        """Write a chunk of matches"""
+        lines = [json.dumps(match, ensure_ascii=False, separators=(",", ":")) for match in matches]
+        self._file.write(("\n".join(lines) + "\n").encode("utf-8"))
+
+    def commit(self) -> int:
+        """Flush to disk and return the resume position"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+class CSVWriter:
+    """Flattened matches with a header row"""
+
+    def __init__(self, path: str, position: int = 0):
+        self.path = path
+        mode = "r+" if position and os.path.exists(path) else "w"
+        self._file = open(path, mode, newline="", encoding="utf-8")
+        if mode == "r+":
+            self._file.truncate(position)
+            self._file.seek(0, os.SEEK_END)
+        self._writer = csv.DictWriter(self._file, fieldnames=FIELDS)
+        if mode == "w":
+            self._writer.writeheader()
+
+    def write(self, matches: List[Dict[str, Any]]):
+        """Write a chunk of matches"""
+        self._writer.writerows(flatten_match(match) for match in matches)
+
+    def commit(self) -> int:
+        """Flush to disk and return the resume position"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Flattened matches as a directory of Parquet part files (requires pyarrow)
+
+    Each committed chunk becomes its own part file so an interrupted export
+    never leaves a half-written file behind; the position is the part count.
+    """
+
+    def __init__(self, path: str, position: int = 0):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export requires the 'pyarrow' package: pip install pyarrow")
+
+        self._pa = pa
+        self._pq = pq
+        self.path = path
+        self.schema = pa.schema([
+            (field, pa.int64() if field in INTEGER_FIELDS else pa.string())
+            for field in FIELDS
+        ])
+        self._part = position
+        self._rows: List[Dict[str, Any]] = []
+
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if name.startswith("part-") and name.endswith(".parquet"):
+                try:
+                    index = int(name[5:-8])
+                except ValueError:
+                    continue
+                if index >= position:
+                    os.remove(os.path.join(path, name))
+
+    def write(self, matches: List[Dict[str, Any]]):
+        """Buffer a chunk of matches until the next commit"""
+        for match in matches:
+            row = flatten_match(match)
+            for field in FIELDS:
+                if field not in INTEGER_FIELDS and row[field] is not None:
+                    row[field] = str(row[field])
+            self._rows.append(row)
+
+    def commit(self) -> int:
+        """Write buffered rows as a new part file and return the resume position"""
+        if self._rows:
+            table = self._pa.Table.from_pylist(self._rows, schema=self.schema)
+            part_path = os.path.join(self.path, f"part-{self._part:05d}.parquet")
+            self._pq.write_table(table, part_path)
+            self._rows = []
+            self._part += 1
+        return self._part
+
+    def close(self):
+        self._rows = []
+
+
+WRITERS = {
+    "ndjson": NDJSONWriter,
+    "csv": CSVWriter,
+    "parquet": ParquetWriter
+}
+
+
+# ============= Checkpoints =============
+
+class ExportCheckpoint:
+    """Last fully exported day and writer position, stored as JSON"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the saved state, or None if there is nothing to resume"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+
+    def save(self, state: Dict[str, Any]):
+        """Atomically replace the saved state"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """Remove the checkpoint after a completed export"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# ============= Export =============
+
+def export_matches(
+    start: date,
+    end: date,
+    path: str,
+    format: str = "ndjson",
+    league_id: Optional[int] = None,
+    chunk_size: int = 5000,
+    checkpoint_path: Optional[str] = None,
+    service: Optional[FootballDataService] = None
+) -> int:
+    """
+    Stream matches from start to end (inclusive) into path
+
+    Only the current chunk is held in memory, so cost is independent of the
+    date range. With a checkpoint, an interrupted export resumes after the
+    last committed day. Returns the total number of exported matches.
+    """
+    if format not in WRITERS:
+        raise ValueError(f"Unknown export format '{format}'. Available: {list(WRITERS.keys())}")
+
+    service = service or FootballDataService()
+    checkpoint = ExportCheckpoint(checkpoint_path or f"{path}.checkpoint.json")
+    job = {
+        "path": os.path.abspath(path),
+        "format": format,
+        "provider": service.provider_name,
+        "league_id": league_id,
+        "start": start.isoformat(),
+        "end": end.isoformat()
+    }
+
+    position = 0
+    total = 0
+    state = checkpoint.load()
+    if state and state.get("job") == job:
+        start = date.fromisoformat(state["last_date"]) + timedelta(days=1)
+        position = state["position"]
+        total = state["rows"]
+        logger.info(f"Resuming export at {start} ({total} matches already written)")
+    elif state:
+        logger.warning(f"Checkpoint {checkpoint.path} belongs to another export, starting over")
+
+    writer = WRITERS[format](path, position)
+    pending = 0
+
+    try:
+        for day, matches in iter_matches(service, start, end, league_id):
+            if matches:
+                writer.write(matches)
+                pending += len(matches)
+
+            # Commit on whole days so a resume never duplicates or skips a day
+            if pending >= chunk_size or day == end:
+                position = writer.commit()
+                total += pending
+                pending = 0
+                checkpoint.save({"job": job, "last_date": day.isoformat(), "position": position, "rows": total})
+                logger.info(f"Exported through {day}: {total} matches")
+    finally:
+        writer.close()
+
+    checkpoint.clear()
+    return total
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Export fixtures for a date range")
+    parser.add_argument("start", type=date.fromisoformat, help="First day (YYYY-MM-DD)")
+    parser.add_argument("end", type=date.fromisoformat, help="Last day (YYYY-MM-DD)")
+    parser.add_argument("path", help="Output file (or directory for parquet)")
+    parser.add_argument("--format", choices=list(WRITERS.keys()), default="ndjson")
+    parser.add_argument("--league", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--checkpoint", default=None)
+    parser.add_argument("--provider", default=None, help="Provider to export from (default from config)")
+    args = parser.parse_args()
+
+    count = export_matches(
+        args.start,
+        args.end,
+        args.path,
+        format=args.format,
+        league_id=args.league,
+        chunk_size=args.chunk_size,
+        checkpoint_path=args.checkpoint,
+        service=FootballDataService(args.provider)
+    )
+    print(f"Exported {count} matches to {args.path}")
@@ -1,10 +1,20 @@
 import os
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+_env_loaded = False
+
+
+def load_env(env_file: Optional[str] = None):
+    """Load variables from a .env file once (python-dotenv is imported on demand)"""
+    global _env_loaded
+    if _env_loaded and env_file is None:
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv(env_file)
+    _env_loaded = True
 
 
 @dataclass
@@ -33,7 +43,11 @@ class APIProviderConfig:
 class APIConfig:
     """Central API configuration manager"""
     
-    def __init__(self):
+    def __init__(self, **overrides: Any):
+        """
+        Read settings from the environment, then apply keyword overrides
+        Providers are loaded on first use, so overrides also apply to them
+        """
         self.timeout = int(os.getenv("API_TIMEOUT", "30"))
         self.retry_attempts = int(os.getenv("API_RETRY_ATTEMPTS", "3"))
         self.cache_duration = int(os.getenv("CACHE_DURATION", "300"))
@@ -42,9 +56,22 @@ class APIConfig:
         self.enable_cache = os.getenv("ENABLE_CACHE", "true").lower() == "true"
         self.log_api_calls = os.getenv("LOG_API_CALLS", "true").lower() == "true"
         self.default_provider = os.getenv("DEFAULT_API_PROVIDER", "api-football")
+        self.max_concurrent_requests = int(os.getenv("MAX_CONCURRENT_REQUESTS", "4"))
+        self.max_pages = int(os.getenv("MAX_PAGES", "100"))
+        
+        for name, value in overrides.items():
+            if name.startswith("_") or not hasattr(self, name):
+                raise ValueError(f"Unknown setting '{name}'")
+            setattr(self, name, value)
         
-        # Initialize providers
-        self._providers = self._load_providers()
+        self._provider_cache: Optional[Dict[str, APIProviderConfig]] = None
+    
+    @property
+    def _providers(self) -> Dict[str, APIProviderConfig]:
+        """Providers, loaded from the environment on first access"""
+        if self._provider_cache is None:
+            self._provider_cache = self._load_providers()
+        return self._provider_cache
     
     def _load_providers(self) -> Dict[str, APIProviderConfig]:
         """Load all available API providers from environment"""
@@ -103,5 +130,48 @@ class APIConfig:
         return provider_name in self._providers
 
 
-# Global configuration instance
-config = APIConfig()
+_config: Optional[APIConfig] = None
+
+
+def init(env_file: Optional[str] = None, use_dotenv: bool = True, **overrides: Any) -> APIConfig:
+    """
+    Build (or rebuild) the global configuration explicitly
+    
+    Call before first use to override settings, e.g. init(timeout=5, enable_cache=False).
+    Clients created afterwards pick up the new settings.
+    """
+    global _config
+    if use_dotenv:
+        load_env(env_file)
+    _config = APIConfig(**overrides)
+    return _config
+
+
+def get_config() -> APIConfig:
+    """Return the global configuration, building it from the environment on first use"""
+    if _config is None:
+        return init()
+    return _config
+
+
+def reset():
+    """Drop the global configuration; the next access rebuilds it"""
+    global _config
+    _config = None
+
+
+class _LazyConfig:
+    """Stand-in for the global APIConfig that defers loading until an attribute is used"""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_config(), name)
+    
+    def __setattr__(self, name: str, value: Any):
+        setattr(get_config(), name, value)
+    
+    def __repr__(self) -> str:
+        return f"<lazy config: {'loaded' if _config is not None else 'not loaded'}>"
+
+
+# Global configuration instance (loaded on first attribute access)
+config = _LazyConfig()
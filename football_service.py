@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from datetime import datetime, date
 from api_client import APIClient, with_fallback
 from config import config
@@ -23,6 +23,10 @@ class FootballDataService:
     @with_fallback("api-football", "football-data", "sports-db")
     def get_live_matches(self, client: APIClient = None) -> List[Dict[str, Any]]:
         """Get all live matches"""
+        return self.get_live_matches_from(client)
+    
+    def get_live_matches_from(self, client: APIClient) -> List[Dict[str, Any]]:
+        """Get all live matches through a specific client (no fallback, never cached)"""
         if client.provider.name == "api-football":
             return self._get_live_matches_api_football(client)
         elif client.provider.name == "football-data":
@@ -32,13 +36,11 @@ class FootballDataService:
     
     def _get_live_matches_api_football(self, client: APIClient) -> List[Dict[str, Any]]:
         """API Football implementation"""
-        data = client.get("fixtures", params={"live": "all"})
-        return self._normalize_matches(data.get("response", []), "api-football")
+        return list(self._iter_normalized_matches(client, "fixtures", {"live": "all"}, "response", use_cache=False))
     
     def _get_live_matches_football_data(self, client: APIClient) -> List[Dict[str, Any]]:
         """Football Data implementation"""
-        data = client.get("matches", params={"status": "LIVE"})
-        return self._normalize_matches(data.get("matches", []), "football-data")
+        return list(self._iter_normalized_matches(client, "matches", {"status": "LIVE"}, "matches", use_cache=False))
     
     def _get_live_matches_sports_db(self, client: APIClient) -> List[Dict[str, Any]]:
         """The Sports DB implementation"""
@@ -64,6 +66,24 @@ class FootballDataService:
         elif client.provider.name == "sports-db":
             return self._get_matches_by_date_sports_db(client, match_date)
     
+    def iter_matches_by_date(
+        self,
+        match_date: date,
+        league_id: Optional[int] = None,
+        use_cache: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield matches for a specific date as each page arrives
+        Uses this service's provider only (no fallback); pass use_cache=False
+        for one-off sweeps so responses are not kept in the client cache
+        """
+        if self.client.provider.name == "api-football":
+            yield from self._iter_matches_by_date_api_football(self.client, match_date, league_id, use_cache)
+        elif self.client.provider.name == "football-data":
+            yield from self._iter_matches_by_date_football_data(self.client, match_date, use_cache)
+        elif self.client.provider.name == "sports-db":
+            yield from self._get_matches_by_date_sports_db(self.client, match_date, use_cache)
+    
     def _get_matches_by_date_api_football(
         self, 
         client: APIClient, 
@@ -71,12 +91,21 @@ class FootballDataService:
         league_id: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """API Football implementation"""
+        return list(self._iter_matches_by_date_api_football(client, match_date, league_id))
+    
+    def _iter_matches_by_date_api_football(
+        self, 
+        client: APIClient, 
+        match_date: date,
+        league_id: Optional[int] = None,
+        use_cache: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """API Football implementation, page by page"""
         params = {"date": match_date.strftime("%Y-%m-%d")}
         if league_id:
             params["league"] = league_id
         
-        data = client.get("fixtures", params=params)
-        return self._normalize_matches(data.get("response", []), "api-football")
+        return self._iter_normalized_matches(client, "fixtures", params, "response", use_cache)
     
     def _get_matches_by_date_football_data(
         self, 
@@ -84,21 +113,30 @@ class FootballDataService:
         match_date: date
     ) -> List[Dict[str, Any]]:
         """Football Data implementation"""
+        return list(self._iter_matches_by_date_football_data(client, match_date))
+    
+    def _iter_matches_by_date_football_data(
+        self, 
+        client: APIClient, 
+        match_date: date,
+        use_cache: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Football Data implementation, page by page"""
         params = {
             "dateFrom": match_date.strftime("%Y-%m-%d"),
             "dateTo": match_date.strftime("%Y-%m-%d")
         }
-        data = client.get("matches", params=params)
-        return self._normalize_matches(data.get("matches", []), "football-data")
+        return self._iter_normalized_matches(client, "matches", params, "matches", use_cache)
     
     def _get_matches_by_date_sports_db(
         self, 
         client: APIClient, 
-        match_date: date
+        match_date: date,
+        use_cache: bool = True
     ) -> List[Dict[str, Any]]:
         """The Sports DB implementation"""
         date_str = match_date.strftime("%Y-%m-%d")
-        data = client.get(f"eventsday.php", params={"d": date_str, "s": "Soccer"})
+        data = client.get(f"eventsday.php", params={"d": date_str, "s": "Soccer"}, use_cache=use_cache)
         return self._normalize_matches(data.get("events", []) or [], "sports-db")
     
     # ============= Leagues =============
@@ -119,13 +157,17 @@ class FootballDataService:
         if country:
             params["country"] = country
         
-        data = client.get("leagues", params=params)
-        return self._normalize_leagues(data.get("response", []), "api-football")
+        leagues = []
+        for page in client.iter_pages("leagues", params=params, items_key="response"):
+            leagues.extend(self._normalize_leagues(page, "api-football"))
+        return leagues
     
     def _get_leagues_football_data(self, client: APIClient) -> List[Dict[str, Any]]:
         """Football Data implementation"""
-        data = client.get("competitions")
-        return self._normalize_leagues(data.get("competitions", []), "football-data")
+        leagues = []
+        for page in client.iter_pages("competitions", items_key="competitions"):
+            leagues.extend(self._normalize_leagues(page, "football-data"))
+        return leagues
     
     def _get_leagues_sports_db(self, client: APIClient, country: Optional[str]) -> List[Dict[str, Any]]:
         """The Sports DB implementation"""
@@ -159,6 +201,20 @@ class FootballDataService:
         data = client.get(f"matches/{match_id}")
         return data
     
+    # ============= Pagination =============
+    
+    def _iter_normalized_matches(
+        self,
+        client: APIClient,
+        endpoint: str,
+        params: Dict[str, Any],
+        items_key: str,
+        use_cache: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Fetch every page of a match listing and normalize each page as it arrives"""
+        for page in client.iter_pages(endpoint, params=params, items_key=items_key, use_cache=use_cache):
+            yield from self._normalize_matches(page, client.provider.name)
+    
     # ============= Normalization Methods =============
     
     def _normalize_matches(self, matches: List[Dict], provider: str) -> List[Dict[str, Any]]:
@@ -0,0 +1,413 @@
+"""
+Local fan-out broker for live match updates
+Polls the provider once and pushes snapshots/deltas to many local subscribers
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import List, Dict, Any, Optional, Callable
+
+from api_client import APIClient
+from config import config, load_env
+from football_service import FootballDataService
+from snapshot_log import SnapshotLogWriter
+
+logger = logging.getLogger(__name__)
+
+# Same order as the fallback on FootballDataService.get_live_matches
+LIVE_PROVIDERS = ("api-football", "football-data", "sports-db")
+
+
+class BrokerMessage:
+    """A snapshot or delta shared by all subscribers, encoded at most once"""
+
+    def __init__(self, type: str, seq: int, timestamp: float, payload: Dict[str, Any]):
+        self.type = type
+        self.seq = seq
+        self.timestamp = timestamp
+        self.payload = payload
+        self._encoded: Optional[bytes] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Message as a plain dict"""
+        return {"type": self.type, "seq": self.seq, "ts": self.timestamp, **self.payload}
+
+    def encode(self) -> bytes:
+        """Message as a newline-terminated JSON line"""
+        if self._encoded is None:
+            self._encoded = (json.dumps(self.to_dict(), separators=(",", ":")) + "\n").encode("utf-8")
+        return self._encoded
+
+
+class Subscriber:
+    """A local consumer with a bounded queue of pending messages"""
+
+    MODES = ("delta", "snapshot")
+    POLICIES = ("drop", "coalesce")
+
+    def __init__(
+        self,
+        name: str,
+        mode: str = "delta",
+        max_pending: int = 32,
+        policy: str = "coalesce",
+        snapshot_provider: Optional[Callable[[], Optional[BrokerMessage]]] = None
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown subscriber mode '{mode}'. Available: {list(self.MODES)}")
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}'. Available: {list(self.POLICIES)}")
+
+        self.name = name
+        self.mode = mode
+        self.max_pending = max(1, max_pending)
+        self.policy = policy
+        self.pending: deque = deque()
+        self.dropped = 0
+        self.closed = False
+        self._needs_snapshot = True
+        self._snapshot_provider = snapshot_provider
+        self._ready = asyncio.Event()
+
+    def offer(self, message: BrokerMessage, snapshot: BrokerMessage):
+        """
+        Queue a message without ever blocking the broker
+
+        When the queue is full, "coalesce" replaces everything pending with the
+        latest snapshot, while "drop" discards the new message and resyncs the
+        reader with a snapshot once it has drained its queue.
+        """
+        if self.closed:
+            return
+
+        if self.mode == "snapshot" or self._needs_snapshot:
+            message = snapshot
+
+        if self.mode == "snapshot" and self.pending:
+            # Only the latest full state matters for snapshot readers
+            self.dropped += len(self.pending)
+            self.pending.clear()
+
+        if len(self.pending) < self.max_pending:
+            self.pending.append(message)
+            self._needs_snapshot = False
+        elif self.policy == "coalesce":
+            self.dropped += len(self.pending)
+            self.pending.clear()
+            self.pending.append(snapshot)
+            self._needs_snapshot = False
+        else:
+            self.dropped += 1
+            self._needs_snapshot = True
+
+        self._ready.set()
+
+    async def get(self) -> Optional[BrokerMessage]:
+        """Wait for the next message, or None once the subscriber is closed"""
+        while not self.pending:
+            if self.closed:
+                return None
+            # A "drop" reader that has caught up resyncs right away, not on the next change
+            if self._needs_snapshot and self._snapshot_provider:
+                snapshot = self._snapshot_provider()
+                if snapshot is not None:
+                    self._needs_snapshot = False
+                    return snapshot
+            self._ready.clear()
+            await self._ready.wait()
+        return self.pending.popleft()
+
+    def close(self):
+        """Stop accepting messages and wake up any waiting reader"""
+        self.closed = True
+        self._ready.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> BrokerMessage:
+        message = await self.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class LiveMatchBroker:
+    """Polls live matches once per interval and fans them out to local subscribers"""
+
+    def __init__(
+        self,
+        service: Optional[FootballDataService] = None,
+        poll_interval: float = 30.0,
+        max_pending: int = 32,
+        policy: str = "coalesce",
+        snapshot_log: Optional[SnapshotLogWriter] = None
+    ):
+        self.service = service or FootballDataService()
+        self.snapshot_log = snapshot_log
+        self.poll_interval = poll_interval
+        self.max_pending = max_pending
+        self.policy = policy
+        self.subscribers: List[Subscriber] = []
+        self.polls = 0
+        self.errors = 0
+        self._matches: Dict[str, Dict[str, Any]] = {}
+        self._seq = 0
+        self._snapshot: Optional[BrokerMessage] = None
+        self._servers: List[Any] = []
+        self.clients = self._build_clients()
+
+    def _build_clients(self) -> List[APIClient]:
+        """
+        One client per provider for the broker's lifetime, service's provider first
+
+        Reusing them keeps the rate limiter, cache and session across polls,
+        which the per-call fallback clients of get_live_matches would not.
+        """
+        clients = [self.service.client]
+        for name in LIVE_PROVIDERS:
+            if name != self.service.client.provider.name and config.is_provider_available(name):
+                clients.append(APIClient(config.get_provider(name)))
+        return clients
+
+    # ============= Subscriptions =============
+
+    def subscribe(
+        self,
+        name: Optional[str] = None,
+        mode: str = "delta",
+        max_pending: Optional[int] = None,
+        policy: Optional[str] = None
+    ) -> Subscriber:
+        """Register a subscriber; it receives the current snapshot first"""
+        subscriber = Subscriber(
+            name or f"subscriber-{len(self.subscribers) + 1}",
+            mode=mode,
+            max_pending=max_pending or self.max_pending,
+            policy=policy or self.policy,
+            snapshot_provider=lambda: self._snapshot
+        )
+        self.subscribers.append(subscriber)
+
+        if self._snapshot is not None:
+            subscriber.offer(self._snapshot, self._snapshot)
+
+        logger.info(f"Subscriber connected: {subscriber.name} ({len(self.subscribers)} total)")
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        """Remove a subscriber and close its queue"""
+        subscriber.close()
+        if subscriber in self.subscribers:
+            self.subscribers.remove(subscriber)
+            logger.info(f"Subscriber disconnected: {subscriber.name} ({len(self.subscribers)} total)")
+
+    # ============= Polling =============
+
+    def publish(self, matches: List[Dict[str, Any]], timestamp: Optional[float] = None) -> Optional[BrokerMessage]:
+        """Diff normalized matches against the last state and fan out the delta"""
+        timestamp = timestamp or time.time()
+        current = {str(match["id"]): match for match in matches}
+
+        changed = [match for key, match in current.items() if self._matches.get(key) != match]
+        removed = [key for key in self._matches if key not in current]
+
+        if self._snapshot is not None and not changed and not removed:
+            return None
+
+        self._seq += 1
+        self._matches = current
+        self._snapshot = BrokerMessage("snapshot", self._seq, timestamp, {"matches": matches})
+        delta = BrokerMessage("delta", self._seq, timestamp, {"changed": changed, "removed": removed})
+
+        for subscriber in list(self.subscribers):
+            subscriber.offer(delta, self._snapshot)
+
+        if self.snapshot_log:
+            try:
+                self.snapshot_log.append(matches, timestamp)
+            except OSError as e:
+                logger.error(f"Failed to write snapshot log: {e}")
+
+        return delta
+
+    def _fetch_live_matches(self) -> List[Dict[str, Any]]:
+        """Try each provider's long-lived client in order until one succeeds"""
+        last_error = None
+
+        for client in self.clients:
+            try:
+                return self.service.get_live_matches_from(client)
+            except Exception as e:
+                last_error = e
+                logger.error(f"Provider {client.provider.name} failed: {e}")
+
+        raise Exception(f"All providers failed. Last error: {last_error}")
+
+    async def poll_once(self) -> Optional[BrokerMessage]:
+        """Fetch live matches once (in a worker thread) and publish them"""
+        loop = asyncio.get_running_loop()
+        matches = await loop.run_in_executor(None, self._fetch_live_matches)
+        self.polls += 1
+        return self.publish(matches or [])
+
+    async def run(self):
+        """Poll forever; one upstream request per interval regardless of subscriber count"""
+        logger.info(f"Broker polling every {self.poll_interval}s")
+
+        while True:
+            started = time.monotonic()
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Live poll failed: {e}")
+
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self.poll_interval - elapsed))
+
+    # ============= Transports =============
+
+    async def _handle_stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, mode: str):
+        """Stream newline-delimited JSON messages to a socket client"""
+        peer = writer.get_extra_info("peername") or "unix"
+        subscriber = self.subscribe(name=f"socket:{peer}", mode=mode)
+
+        try:
+            async for message in subscriber:
+                writer.write(message.encode())
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.unsubscribe(subscriber)
+            writer.close()
+
+    async def serve_unix(self, path: str, mode: str = "delta"):
+        """Accept subscribers on a Unix domain socket"""
+        if os.path.exists(path):
+            # Only reclaim a stale socket; never take over a live broker's path
+            try:
+                _, writer = await asyncio.open_unix_connection(path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(path)
+            else:
+                writer.close()
+                raise RuntimeError(f"Another process is already listening on unix:{path}")
+
+        server = await asyncio.start_unix_server(
+            lambda reader, writer: self._handle_stream(reader, writer, mode),
+            path=path
+        )
+        self._servers.append(server)
+        logger.info(f"Broker listening on unix:{path}")
+        return server
+
+    async def serve_tcp(self, host: str = "127.0.0.1", port: int = 8765, mode: str = "delta"):
+        """Accept subscribers on a local TCP socket"""
+        server = await asyncio.start_server(
+            lambda reader, writer: self._handle_stream(reader, writer, mode),
+            host=host,
+            port=port
+        )
+        self._servers.append(server)
+        logger.info(f"Broker listening on tcp:{host}:{port}")
+        return server
+
+    async def serve_websocket(self, host: str = "127.0.0.1", port: int = 8766, mode: str = "delta"):
+        """Accept subscribers over WebSockets (requires the optional 'websockets' package)"""
+        try:
+            import websockets
+        except ImportError:
+            raise ImportError("WebSocket transport requires the 'websockets' package: pip install websockets")
+
+        async def handler(websocket, *args):
+            subscriber = self.subscribe(name=f"ws:{websocket.remote_address}", mode=mode)
+            try:
+                async for message in subscriber:
+                    await websocket.send(message.encode().decode("utf-8"))
+            except websockets.exceptions.ConnectionClosed:
+                pass
+            finally:
+                self.unsubscribe(subscriber)
+
+        server = await websockets.serve(handler, host, port)
+        self._servers.append(server)
+        logger.info(f"Broker listening on ws://{host}:{port}")
+        return server
+
+    async def close(self):
+        """Close all listeners and subscribers"""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+
+        for subscriber in list(self.subscribers):
+            self.unsubscribe(subscriber)
+
+        for client in self.clients:
+            client.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Broker counters for monitoring"""
+        return {
+            "polls": self.polls,
+            "errors": self.errors,
+            "seq": self._seq,
+            "live_matches": len(self._matches),
+            "subscribers": [
+                {
+                    "name": s.name,
+                    "mode": s.mode,
+                    "pending": len(s.pending),
+                    "dropped": s.dropped
+                }
+                for s in self.subscribers
+            ]
+        }
+
+
+async def main(
+    socket_path: str,
+    poll_interval: float,
+    tcp_port: Optional[int] = None,
+    log_dir: Optional[str] = None
+):
+    """Run the broker on a Unix socket (and optionally a local TCP port)"""
+    snapshot_log = SnapshotLogWriter(log_dir) if log_dir else None
+    broker = LiveMatchBroker(poll_interval=poll_interval, snapshot_log=snapshot_log)
+    await broker.serve_unix(socket_path)
+    if tcp_port:
+        await broker.serve_tcp(port=tcp_port)
+
+    try:
+        await broker.run()
+    finally:
+        await broker.close()
+        if broker.snapshot_log:
+            broker.snapshot_log.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+
+    # .env is loaded lazily; the defaults below need it before config is first touched
+    load_env()
+
+    parser = argparse.ArgumentParser(description="Fan out live match updates to local subscribers")
+    parser.add_argument("--socket", default=os.getenv("BROKER_SOCKET", "/tmp/live-matches.sock"))
+    parser.add_argument("--interval", type=float, default=float(os.getenv("BROKER_POLL_INTERVAL", "30")))
+    parser.add_argument("--tcp-port", type=int, default=None)
+    parser.add_argument("--log-dir", default=os.getenv("SNAPSHOT_LOG_DIR"), help="Record snapshots for replay")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.socket, args.interval, args.tcp_port, args.log_dir))
@@ -0,0 +1,407 @@
+"""
+Append-only binary log of normalized live match snapshots
+Fixed-width records plus an interned string table, rotated per UTC day
+"""
+
+import logging
+import math
+import mmap
+import os
+import struct
+import time
+from datetime import date, datetime, timezone
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Record layout (little endian, 70 bytes):
+#   timestamp                                              float64
+#   id, provider, date, status                             string refs
+#   minute, home score, away score                         int16 (-1 = None)
+#   league id, name, country, logo                         string refs
+#   home team id, name, logo / away team id, name, logo   string refs
+RECORD = struct.Struct("<d4I3h4I3I3I")
+RECORD_SIZE = RECORD.size
+TIMESTAMP = struct.Struct("<d")
+MATCH_REF = struct.Struct("<I")
+MATCH_REF_OFFSET = TIMESTAMP.size
+
+# String table entry header: kind (0 = str, 1 = int), payload length
+STRING_HEADER = struct.Struct("<BI")
+KIND_STR = 0
+KIND_INT = 1
+
+NONE_REF = 0xFFFFFFFF
+NONE_SHORT = -1
+
+TimeLike = Union[float, int, datetime, None]
+
+
+def _to_epoch(value: TimeLike) -> Optional[float]:
+    """Convert a datetime or epoch value to epoch seconds"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+
+def _string_key(value: Any) -> Optional[Tuple[int, str]]:
+    """Interning key for a value stored in the string table"""
+    if value is None:
+        return None
+    if isinstance(value, int) and not isinstance(value, bool):
+        return (KIND_INT, str(value))
+    return (KIND_STR, str(value))
+
+
+def _lookup_keys(value: Any) -> List[Tuple[int, str]]:
+    """Interning keys a match id may be stored under (ids from CLI/JSON arrive as strings)"""
+    text = str(value)
+    keys = [(KIND_STR, text)]
+    try:
+        keys.append((KIND_INT, str(int(text))))
+    except ValueError:
+        pass
+    return keys
+
+
+def _short(value: Any) -> int:
+    """Pack an optional small integer into int16"""
+    return NONE_SHORT if value is None else int(value)
+
+
+def _day_of(timestamp: float) -> date:
+    """UTC day a timestamp belongs to (the rotation unit)"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).date()
+
+
+def _read_strings(path: str) -> Tuple[List[Any], int]:
+    """Parse a string table; returns values and the length of the valid prefix"""
+    values: List[Any] = []
+    if not os.path.exists(path):
+        return values, 0
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    offset = 0
+    while offset + STRING_HEADER.size <= len(data):
+        kind, length = STRING_HEADER.unpack_from(data, offset)
+        end = offset + STRING_HEADER.size + length
+        if end > len(data):
+            break  # torn write at the tail
+        text = data[offset + STRING_HEADER.size:end].decode("utf-8")
+        values.append(int(text) if kind == KIND_INT else text)
+        offset = end
+
+    return values, offset
+
+
+class SnapshotLogWriter:
+    """Appends normalized match snapshots to per-day log files"""
+
+    def __init__(self, directory: str, prefix: str = "snapshots"):
+        self.directory = directory
+        self.prefix = prefix
+        self._day: Optional[date] = None
+        self._records = None
+        self._strings = None
+        self._interned: Dict[Tuple[int, str], int] = {}
+        self._last_timestamp = 0.0
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, day: date) -> Tuple[str, str]:
+        stem = os.path.join(self.directory, f"{self.prefix}-{day.strftime('%Y%m%d')}")
+        return f"{stem}.log", f"{stem}.str"
+
+    def _open_day(self, day: date):
+        """Rotate to the files for the given day, recovering from torn writes"""
+        self.close()
+        records_path, strings_path = self._paths(day)
+
+        values, valid = _read_strings(strings_path)
+        if os.path.exists(strings_path) and os.path.getsize(strings_path) != valid:
+            os.truncate(strings_path, valid)
+        self._interned = {_string_key(value): index for index, value in enumerate(values)}
+
+        self._last_timestamp = 0.0
+        if os.path.exists(records_path):
+            size = os.path.getsize(records_path)
+            count = size // RECORD_SIZE
+            if size != count * RECORD_SIZE:
+                os.truncate(records_path, count * RECORD_SIZE)
+            if count:
+                with open(records_path, "rb") as f:
+                    f.seek((count - 1) * RECORD_SIZE)
+                    self._last_timestamp = TIMESTAMP.unpack(f.read(TIMESTAMP.size))[0]
+
+        self._strings = open(strings_path, "ab")
+        self._records = open(records_path, "ab")
+        self._day = day
+        logger.info(f"Snapshot log opened: {records_path}")
+
+    def _ref(self, value: Any) -> int:
+        """Intern a value and return its string table index"""
+        key = _string_key(value)
+        if key is None:
+            return NONE_REF
+
+        index = self._interned.get(key)
+        if index is None:
+            payload = key[1].encode("utf-8")
+            self._strings.write(STRING_HEADER.pack(key[0], len(payload)) + payload)
+            index = len(self._interned)
+            self._interned[key] = index
+        return index
+
+    def append(self, matches: List[Dict[str, Any]], timestamp: Optional[float] = None) -> int:
+        """Append one poll's worth of normalized matches; returns records written"""
+        timestamp = timestamp or time.time()
+        day = _day_of(timestamp)
+        if day != self._day:
+            self._open_day(day)
+
+        # Readers binary search on time and replay() groups polls by timestamp,
+        # so keep each file strictly increasing even if the clock steps back
+        if timestamp <= self._last_timestamp:
+            timestamp = math.nextafter(self._last_timestamp, math.inf)
+        self._last_timestamp = timestamp
+
+        chunk = bytearray()
+        for match in matches:
+            try:
+                league = match.get("league") or {}
+                home = match.get("home_team") or {}
+                away = match.get("away_team") or {}
+                score = match.get("score") or {}
+                chunk += RECORD.pack(
+                    timestamp,
+                    self._ref(match["id"]),
+                    self._ref(match.get("provider")),
+                    self._ref(match.get("date")),
+                    self._ref(match.get("status")),
+                    _short(match.get("minute")),
+                    _short(score.get("home")),
+                    _short(score.get("away")),
+                    self._ref(league.get("id")),
+                    self._ref(league.get("name")),
+                    self._ref(league.get("country")),
+                    self._ref(league.get("logo")),
+                    self._ref(home.get("id")),
+                    self._ref(home.get("name")),
+                    self._ref(home.get("logo")),
+                    self._ref(away.get("id")),
+                    self._ref(away.get("name")),
+                    self._ref(away.get("logo"))
+                )
+            except (KeyError, TypeError, ValueError, struct.error) as e:
+                logger.error(f"Error encoding match snapshot: {e}")
+                continue
+
+        # Strings must hit disk before the records that reference them
+        self._strings.flush()
+        self._records.write(chunk)
+        self._records.flush()
+
+        return len(chunk) // RECORD_SIZE
+
+    def close(self):
+        """Close the current day's files"""
+        for f in (self._records, self._strings):
+            if f:
+                f.close()
+        self._records = None
+        self._strings = None
+        self._day = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _DayLog:
+    """Memory-mapped view of one day's records"""
+
+    def __init__(self, records_path: str, strings_path: str):
+        # Size the records before reading strings: the writer flushes strings
+        # first, so every record counted here can be resolved even mid-append
+        self._file = open(records_path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self.count = size // RECORD_SIZE
+        self._map = mmap.mmap(self._file.fileno(), self.count * RECORD_SIZE, access=mmap.ACCESS_READ) if self.count else None
+
+        self.strings, _ = _read_strings(strings_path)
+        self.refs = {_string_key(value): index for index, value in enumerate(self.strings)}
+
+    def timestamp_at(self, index: int) -> float:
+        return TIMESTAMP.unpack_from(self._map, index * RECORD_SIZE)[0]
+
+    def bisect(self, timestamp: float) -> int:
+        """First record index with a timestamp >= the given one"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamp_at(middle) < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _string(self, ref: int) -> Any:
+        if ref == NONE_REF:
+            return None
+        if ref >= len(self.strings):
+            raise ValueError(f"Corrupt snapshot log: string ref {ref} outside table of {len(self.strings)}")
+        return self.strings[ref]
+
+    def decode(self, index: int) -> Tuple[float, Dict[str, Any]]:
+        """Rebuild the normalized match dict for a record"""
+        (timestamp, match_id, provider, match_date, status,
+         minute, home_score, away_score,
+         league_id, league_name, league_country, league_logo,
+         home_id, home_name, home_logo,
+         away_id, away_name, away_logo) = RECORD.unpack_from(self._map, index * RECORD_SIZE)
+
+        s = self._string
+        return timestamp, {
+            "id": s(match_id),
+            "date": s(match_date),
+            "status": s(status),
+            "minute": None if minute == NONE_SHORT else minute,
+            "league": {
+                "id": s(league_id),
+                "name": s(league_name),
+                "country": s(league_country),
+                "logo": s(league_logo)
+            },
+            "home_team": {
+                "id": s(home_id),
+                "name": s(home_name),
+                "logo": s(home_logo)
+            },
+            "away_team": {
+                "id": s(away_id),
+                "name": s(away_name),
+                "logo": s(away_logo)
+            },
+            "score": {
+                "home": None if home_score == NONE_SHORT else home_score,
+                "away": None if away_score == NONE_SHORT else away_score
+            },
+            "provider": s(provider)
+        }
+
+    def iter_records(
+        self,
+        start: Optional[float],
+        end: Optional[float],
+        match_id: Any = None
+    ) -> Iterator[Tuple[float, Dict[str, Any]]]:
+        if not self.count:
+            return
+
+        wanted = None
+        if match_id is not None:
+            wanted = {self.refs[key] for key in _lookup_keys(match_id) if key in self.refs}
+            if not wanted:
+                return
+
+        index = self.bisect(start) if start is not None else 0
+        while index < self.count:
+            if end is not None and self.timestamp_at(index) >= end:
+                break
+            if wanted is None or MATCH_REF.unpack_from(self._map, index * RECORD_SIZE + MATCH_REF_OFFSET)[0] in wanted:
+                yield self.decode(index)
+            index += 1
+
+    def close(self):
+        if self._map:
+            self._map.close()
+        self._file.close()
+
+
+class SnapshotLogReader:
+    """Iterates logged snapshots by time range or match id without loading whole files"""
+
+    def __init__(self, directory: str, prefix: str = "snapshots"):
+        self.directory = directory
+        self.prefix = prefix
+
+    def days(self) -> List[date]:
+        """Days that have a snapshot log, oldest first"""
+        days = []
+        if not os.path.isdir(self.directory):
+            return days
+
+        head = f"{self.prefix}-"
+        for name in os.listdir(self.directory):
+            if name.startswith(head) and name.endswith(".log"):
+                try:
+                    days.append(datetime.strptime(name[len(head):-4], "%Y%m%d").date())
+                except ValueError:
+                    continue
+        return sorted(days)
+
+    def _open(self, day: date) -> _DayLog:
+        stem = os.path.join(self.directory, f"{self.prefix}-{day.strftime('%Y%m%d')}")
+        return _DayLog(f"{stem}.log", f"{stem}.str")
+
+    def iter_records(
+        self,
+        start: TimeLike = None,
+        end: TimeLike = None,
+        match_id: Any = None
+    ) -> Iterator[Tuple[float, Dict[str, Any]]]:
+        """Yield (timestamp, match) pairs in [start, end), optionally for one match"""
+        start_ts, end_ts = _to_epoch(start), _to_epoch(end)
+        first_day = _day_of(start_ts) if start_ts is not None else None
+        last_day = _day_of(end_ts) if end_ts is not None else None
+
+        for day in self.days():
+            if (first_day and day < first_day) or (last_day and day > last_day):
+                continue
+
+            day_log = self._open(day)
+            try:
+                yield from day_log.iter_records(start_ts, end_ts, match_id)
+            finally:
+                day_log.close()
+
+    def replay(
+        self,
+        start: TimeLike = None,
+        end: TimeLike = None,
+        match_id: Any = None,
+        speed: Optional[float] = None
+    ) -> Iterator[Tuple[float, List[Dict[str, Any]]]]:
+        """
+        Yield (timestamp, matches) per logged poll
+
+        With no speed, polls are yielded as fast as they can be read; otherwise
+        the original spacing is replayed scaled by speed (e.g. 60 = one hour per minute).
+        """
+        current_ts: Optional[float] = None
+        batch: List[Dict[str, Any]] = []
+        previous_ts: Optional[float] = None
+
+        def pace(timestamp: float):
+            if speed and previous_ts is not None:
+                time.sleep(max(0.0, (timestamp - previous_ts) / speed))
+
+        for timestamp, match in self.iter_records(start, end, match_id):
+            if current_ts is not None and timestamp != current_ts:
+                pace(current_ts)
+                yield current_ts, batch
+                previous_ts = current_ts
+                batch = []
+            current_ts = timestamp
+            batch.append(match)
+
+        if current_ts is not None:
+            pace(current_ts)
+            yield current_ts, batch